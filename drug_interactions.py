@@ -134,18 +134,26 @@ def check_inhibitor_effects(drugs: List[str], risk_results: List[Dict]) -> List[
     return interactions
 
 
+SEVERITY_RANK  = {"low": 0, "moderate": 1, "high": 2, "critical": 3}
+SEVERITY_NAMES = tuple(sorted(SEVERITY_RANK, key=SEVERITY_RANK.get))
+_MAX_RANK      = len(SEVERITY_NAMES) - 1
+
+
 def run_interaction_analysis(drugs: List[str], risk_results: List[Dict]) -> Dict:
     phenotype_map = {r.get("primary_gene", ""): r.get("phenotype", "Unknown") for r in risk_results}
     shared_gene  = check_shared_gene_risk(drugs, phenotype_map)
     known        = check_known_interactions(drugs)
     inhibitor    = check_inhibitor_effects(drugs, risk_results)
     all_interactions = shared_gene + known + inhibitor
-    SEVERITY_RANK = {"low": 0, "moderate": 1, "high": 2, "critical": 3}
-    overall = "none"
+    # Reduce over integer ranks and stop at "critical"; "none" when nothing found.
+    top = -1
     for ix in all_interactions:
-        s = ix.get("severity", "low")
-        if SEVERITY_RANK.get(s, 0) > SEVERITY_RANK.get(overall, -1):
-            overall = s
+        rank = SEVERITY_RANK.get(ix.get("severity", "low"), 0)
+        if rank > top:
+            top = rank
+            if top == _MAX_RANK:
+                break
+    overall = SEVERITY_NAMES[top] if top >= 0 else "none"
     return {
         "interactions_found":    len(all_interactions) > 0,
         "total_interactions":    len(all_interactions),
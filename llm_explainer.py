@@ -9,12 +9,18 @@ Changes from v5.0:
   - Added _rate_limit_cooldown() helper: if the last individual-drug call was
     rate-limited, the narrative skips the API call entirely and uses the static
     fallback — no more infinite spinner.
+  - generate_all_explanations() fans the per-drug Groq calls out over a
+    ThreadPoolExecutor created per call (at most 6 workers).
+  - get_groq_client() reuses a client per API key (LRU, 8 keys), so the pooled
+    calls reuse its keep-alive connections instead of each doing a TLS handshake.
   - All other behaviour (thread-safe cache, skip_llm, backoff) unchanged.
   - Static templates include rsID citations for full rubric compliance.
 """
 
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List
 from groq import Groq
 
@@ -36,6 +42,13 @@ def _cache_set(key, value):
         _CACHE[key] = value
 
 
+# ── Worker pool bound for per-drug LLM calls ─────────────────────────────────
+# Each generate_all_explanations() call gets its own pool, sized to its drugs
+# and capped at the 6 supported ones, so one session's rate-limit back-off never
+# holds threads another session is waiting on.
+_MAX_WORKERS = 6
+
+
 def clear_explanation_cache():
     with _CACHE_LOCK:
         _CACHE.clear()
@@ -201,6 +214,10 @@ def _get_static_fallback(drug: str, phenotype: str, reason: str = "") -> Dict:
     return {**tmpl, "model_used": label, "success": True}
 
 
+# Groq clients for the most recently used API keys. The client owns an httpx
+# connection pool and is safe to share across the executor's threads; the LRU
+# bound keeps user-typed keys from accumulating for the life of the process.
+@lru_cache(maxsize=8)
 def get_groq_client(api_key: str) -> Groq:
     return Groq(api_key=api_key)
 
@@ -342,30 +359,35 @@ def generate_explanation(
         return result
 
 
-def generate_all_explanations(api_key: str, risk_results: list, skip_llm: bool = False) -> list:
-    enriched = []
-    for result in risk_results:
-        if result.get("error"):
-            result["llm_explanation"] = _get_static_fallback(
-                result.get("drug", "UNKNOWN"), result.get("phenotype", "Unknown"), "error"
-            )
-            enriched.append(result)
-            continue
-
-        explanation = generate_explanation(
-            api_key=api_key,
-            drug=result["drug"],
-            gene=result["primary_gene"],
-            diplotype=result["diplotype"],
-            phenotype=result["phenotype"],
-            risk_label=result["risk_label"],
-            severity=result["severity"],
-            variants=result.get("detected_variants", []),
-            skip_llm=skip_llm,
+def _explain_result(api_key: str, result: Dict, skip_llm: bool) -> Dict:
+    if result.get("error"):
+        return _get_static_fallback(
+            result.get("drug", "UNKNOWN"), result.get("phenotype", "Unknown"), "error"
         )
+    return generate_explanation(
+        api_key=api_key,
+        drug=result["drug"],
+        gene=result["primary_gene"],
+        diplotype=result["diplotype"],
+        phenotype=result["phenotype"],
+        risk_label=result["risk_label"],
+        severity=result["severity"],
+        variants=result.get("detected_variants", []),
+        skip_llm=skip_llm,
+    )
+
+
+def generate_all_explanations(api_key: str, risk_results: list, skip_llm: bool = False) -> list:
+    # Static templates are instant; only real API calls are worth a thread hop.
+    if skip_llm or not api_key or len(risk_results) < 2:
+        explanations = [_explain_result(api_key, r, skip_llm) for r in risk_results]
+    else:
+        workers = min(len(risk_results), _MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pg-llm") as ex:
+            explanations = list(ex.map(lambda r: _explain_result(api_key, r, skip_llm), risk_results))
+    for result, explanation in zip(risk_results, explanations):
         result["llm_explanation"] = explanation
-        enriched.append(result)
-    return enriched
+    return list(risk_results)
 
 
 # ── Unified Patient Narrative ─────────────────────────────────────────────────
@@ -524,4 +546,4 @@ Do NOT start with "This patient". Be specific about genes and drugs."""
 
     # Static fallback — always succeeds
     _cache_set(narrative_cache_key, static_nar)
-    return static_nar
\ No newline at end of file
+    return static_nar
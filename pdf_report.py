@@ -5,8 +5,8 @@ FIXED: Replaced all Unicode special characters (en-dash, em-dash, etc.)
 """
 
 from fpdf import FPDF
-from datetime import datetime
-from typing import List, Dict
+from datetime import date, datetime
+from typing import List, Dict, Optional
 
 RISK_COLORS = {
     "Safe":          (6,   95,  70),
@@ -122,7 +122,9 @@ class SurakshaRxPDF(FPDF):
         self.set_text_color(0, 0, 0)
 
 
-def generate_pdf_report(patient_id: str, all_outputs: List[Dict], parsed_vcf: Dict) -> bytes:
+def generate_pdf_report(patient_id: str, all_outputs: List[Dict], parsed_vcf: Dict,
+                        report_date: Optional[date] = None) -> bytes:
+    report_date = report_date or datetime.utcnow().date()
     pdf = SurakshaRxPDF()
     pdf.add_page()
 
@@ -140,7 +142,7 @@ def generate_pdf_report(patient_id: str, all_outputs: List[Dict], parsed_vcf: Di
     pdf.cell(60, 7, f"Genes Analyzed: {len(parsed_vcf.get('detected_genes', []))}/6", ln=False)
     pdf.cell(0,  7, f"Drugs Evaluated: {len(all_outputs)}", ln=True)
     pdf.set_x(18)
-    pdf.cell(0,  7, f"Variants Detected: {parsed_vcf.get('total_variants', 0)}  |  Report Date: {datetime.utcnow().strftime('%B %d, %Y')}", ln=True)
+    pdf.cell(0,  7, f"Variants Detected: {parsed_vcf.get('total_variants', 0)}  |  Report Date: {report_date.strftime('%B %d, %Y')}", ln=True)
     pdf.ln(6)
 
     # Genomic profile summary
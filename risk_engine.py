@@ -270,12 +270,17 @@ def run_risk_assessment(parsed_vcf: Dict, drugs: List[str]) -> List[Dict]:
 
 
 SEVERITY_ORDER = {"none": 0, "low": 1, "moderate": 2, "high": 3, "critical": 4}
+SEVERITY_NAMES = tuple(sorted(SEVERITY_ORDER, key=SEVERITY_ORDER.get))
+_MAX_SEVERITY  = len(SEVERITY_NAMES) - 1
 
 
 def get_overall_severity(results: List[Dict]) -> str:
-    max_severity = "none"
+    # Reduce over integer ranks (one lookup per result) and stop at "critical".
+    top = 0
     for r in results:
-        s = r.get("severity", "none")
-        if SEVERITY_ORDER.get(s, 0) > SEVERITY_ORDER.get(max_severity, 0):
-            max_severity = s
-    return max_severity
\ No newline at end of file
+        rank = SEVERITY_ORDER.get(r.get("severity", "none"), 0)
+        if rank > top:
+            top = rank
+            if top == _MAX_SEVERITY:
+                break
+    return SEVERITY_NAMES[top]
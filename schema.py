@@ -6,11 +6,16 @@ FIXES:
   - SIMVASTATIN alternative_drugs keys renamed: "Poor Function" -> "PM", "Decreased Function" -> "IM"
   - SIMVASTATIN monitoring keys renamed: "Poor Function" -> "PM", "Decreased Function" -> "IM"
   - CONTRAINDICATED_COMBOS updated: ("SIMVASTATIN", "Poor Function") -> ("SIMVASTATIN", "PM")
+  - dumps_output(): JSON export via orjson (a requirements.txt dependency)
+  - DrugView: flat, slotted per-drug view of an output for the render path
 """
 
+from dataclasses import dataclass
 from typing import List, Dict
 from datetime import datetime
 
+import orjson
+
 
 # ── Alternative drug suggestions per (drug, phenotype) ───────────────────────
 ALTERNATIVE_DRUGS = {
@@ -161,4 +166,27 @@ def build_output_schema(
             "parse_errors":        parsed_vcf.get("parse_errors", []),
             "explanation_generated": llm_exp.get("success", False),
         },
-    }
\ No newline at end of file
+    }
+
+
+def dumps_output(obj) -> bytes:
+    """Serialise schema output (or interaction results) as indented UTF-8 JSON."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
+@dataclass(slots=True, frozen=True)
+class DrugView:
+    """The per-drug fields the dashboard renders, flattened out of the output schema."""
+    drug:       str
+    risk_label: str
+    severity:   str
+    confidence: float
+    gene:       str
+    diplotype:  str
+    phenotype:  str
+
+    @classmethod
+    def from_output(cls, o: Dict) -> "DrugView":
+        ra, pp = o["risk_assessment"], o["pharmacogenomic_profile"]
+        return cls(o["drug"], ra["risk_label"], ra["severity"], ra["confidence_score"],
+                   pp["primary_gene"], pp["diplotype"], pp["phenotype"])
@@ -0,0 +1,361 @@
+"""
+UI configuration tables for SurakshaRx v9.3
+Colour palettes, population frequencies, chromosome positions, plain-language
+copy, demo personas and the built-in test suite.
+Lives outside app.py because Streamlit re-executes the main script on every
+rerun; tables defined here are built once per process and then served from the
+module cache.
+"""
+
+import streamlit as st
+
+from risk_engine import DRUG_RISK_TABLE
+
+
+class FallbackDict(dict):
+    """dict that answers missing keys with a fixed default (without storing it),
+    so render loops can index directly instead of .get(key, table[default])."""
+
+    def __init__(self, data, default):
+        super().__init__(data)
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
+
+
+ALL_DRUGS = list(DRUG_RISK_TABLE.keys())
+GENE_DRUG_MAP = {
+    "CODEINE": "CYP2D6", "WARFARIN": "CYP2C9", "CLOPIDOGREL": "CYP2C19",
+    "SIMVASTATIN": "SLCO1B1", "AZATHIOPRINE": "TPMT", "FLUOROURACIL": "DPYD",
+}
+
+# Sidebar "Gene → Drug Map" rendered as one markdown block instead of one call per row
+SIDEBAR_GENE_MAP_MD = "\n\n".join(f"`{gene}` → {drug.title()}" for drug, gene in GENE_DRUG_MAP.items())
+
+
+def drug_label(drug: str) -> str:
+    """Option label for drug pickers, e.g. "Codeine  (CYP2D6)"."""
+    return f"{drug.title()}  ({GENE_DRUG_MAP.get(drug, '')})"
+
+
+class DrugLabels(dict):
+    """Precomputed picker labels; custom drugs typed in the sidebar are labelled
+    on the fly, so DRUG_LABELS.__getitem__ can serve directly as a format_func."""
+
+    def __missing__(self, drug):
+        return drug_label(drug)
+
+
+DRUG_LABELS = DrugLabels({d: drug_label(d) for d in ALL_DRUGS})
+
+RISK_CFG = {
+    "Safe":         {"color":"#16A34A","bg":"#F0FDF4","border":"#BBF7D0","text":"#14532D","tag_bg":"#DCFCE7","tag_text":"#15803D","shape":"●","severity_dot":"#16A34A"},
+    "Adjust Dosage":{"color":"#D97706","bg":"#FFFBEB","border":"#FDE68A","text":"#78350F","tag_bg":"#FEF3C7","tag_text":"#92400E","shape":"▲","severity_dot":"#D97706"},
+    "Toxic":        {"color":"#B91C1C","bg":"#FEF2F2","border":"#FECACA","text":"#7F1D1D","tag_bg":"#FEE2E2","tag_text":"#991B1B","shape":"⬛","severity_dot":"#DC2626"},
+    "Ineffective":  {"color":"#6D28D9","bg":"#F5F3FF","border":"#DDD6FE","text":"#4C1D95","tag_bg":"#EDE9FE","tag_text":"#5B21B6","shape":"◆","severity_dot":"#7C3AED"},
+    "Unknown":      {"color":"#475569","bg":"#F8FAFC","border":"#E2E8F0","text":"#334155","tag_bg":"#F1F5F9","tag_text":"#475569","shape":"?","severity_dot":"#64748B"},
+}
+
+SEV_CFG = {
+    "none":     {"color":"#16A34A","bg":"#F0FDF4","border":"#BBF7D0","text":"#14532D","label":"None"},
+    "low":      {"color":"#D97706","bg":"#FFFBEB","border":"#FDE68A","text":"#78350F","label":"Low"},
+    "moderate": {"color":"#EA580C","bg":"#FFF7ED","border":"#FED7AA","text":"#7C2D12","label":"Moderate"},
+    "high":     {"color":"#DC2626","bg":"#FEF2F2","border":"#FECACA","text":"#7F1D1D","label":"High"},
+    "critical": {"color":"#B91C1C","bg":"#FFF1F1","border":"#FCA5A5","text":"#450A0A","label":"Critical"},
+}
+
+PHENO_CFG = {
+    "PM":      {"bg":"#FEF2F2","border":"#FECACA","text":"#7F1D1D","bar":"#DC2626","label":"Poor Metabolizer","pct":5},
+    "IM":      {"bg":"#FFFBEB","border":"#FDE68A","text":"#78350F","bar":"#D97706","label":"Intermediate Metabolizer","pct":45},
+    "NM":      {"bg":"#F0FDF4","border":"#BBF7D0","text":"#14532D","bar":"#16A34A","label":"Normal Metabolizer","pct":100},
+    "RM":      {"bg":"#EFF6FF","border":"#BFDBFE","text":"#1E3A8A","bar":"#2563EB","label":"Rapid Metabolizer","pct":115},
+    "URM":     {"bg":"#FFF7ED","border":"#FED7AA","text":"#7C2D12","bar":"#EA580C","label":"Ultrarapid Metabolizer","pct":130},
+    "Unknown": {"bg":"#F8FAFC","border":"#E2E8F0","text":"#475569","bar":"#94A3B8","label":"Unknown","pct":0},
+}
+
+# Unrecognised labels resolve to the neutral entry, so renderers index directly.
+RISK_CFG  = FallbackDict(RISK_CFG, RISK_CFG["Unknown"])
+SEV_CFG   = FallbackDict(SEV_CFG, SEV_CFG["none"])
+PHENO_CFG = FallbackDict(PHENO_CFG, PHENO_CFG["Unknown"])
+
+SEV_EMOJI = {"none": "✓", "low": "△", "moderate": "⚠", "high": "⛔", "critical": "🚨"}
+
+# Display order of the gene activity row and the drug × gene heatmap axes
+GENE_ROW_ORDER = ("CYP2D6", "CYP2C19", "CYP2C9", "SLCO1B1", "TPMT", "DPYD")
+HM_DRUG_ORDER  = ("CODEINE", "WARFARIN", "CLOPIDOGREL", "SIMVASTATIN", "AZATHIOPRINE", "FLUOROURACIL")
+HM_GENE_ORDER  = ("CYP2D6", "CYP2C9", "CYP2C19", "SLCO1B1", "TPMT", "DPYD")
+
+IX_CELL_CFG = {
+    "critical": {"bg":"#FEF2F2","text":"#7F1D1D","border":"#FECACA"},
+    "high":     {"bg":"#FEF2F2","text":"#7F1D1D","border":"#FECACA"},
+    "moderate": {"bg":"#FFFBEB","text":"#78350F","border":"#FDE68A"},
+    "low":      {"bg":"#FEFCE8","text":"#713F12","border":"#FDE047"},
+    "none":     {"bg":"#F0FDF4","text":"#14532D","border":"#BBF7D0"},
+    "diag":     {"bg":"#F1F5F9","text":"#64748B","border":"#E2E8F0"},
+}
+IX_CELL_CFG = FallbackDict(IX_CELL_CFG, IX_CELL_CFG["none"])
+
+
+def ix_cell_html(sv: str) -> str:
+    """One interaction-matrix cell for severity sv ("diag" for the diagonal)."""
+    mc  = IX_CELL_CFG[sv]
+    lbl = "—" if sv == "diag" else "OK" if sv == "none" else sv.upper()
+    return (f'<div class="ix-cell" style="background:{mc["bg"]};border-color:{mc["border"]};'
+            f'color:{mc["text"]};">{lbl}</div>')
+
+
+IX_CELL_HTML = {sv: ix_cell_html(sv) for sv in IX_CELL_CFG}
+
+RX_VERDICT = {
+    "Safe":         "✓ Safe to Prescribe",
+    "Adjust Dosage":"△ Prescribe with Dose Adjustment",
+    "Toxic":        "⛔ Do Not Prescribe — Toxicity Risk",
+    "Ineffective":  "◆ Do Not Prescribe — Drug Ineffective",
+}
+
+# "Without SurakshaRx" outcome on the before/after card; {drug} is lower-cased.
+BEFORE_OUTCOME = {
+    "Toxic":       "Standard {drug} dose → toxic accumulation → serious harm",
+    "Ineffective": "Standard {drug} dose → zero therapeutic effect → treatment failure",
+}
+
+PATIENT_VERDICT = {
+    "Safe":         "✓ This medicine is likely safe for you",
+    "Adjust Dosage":"△ You may need a different dose",
+    "Toxic":        "⛔ This medicine could be harmful to you",
+    "Ineffective":  "◆ This medicine likely won't work for you",
+}
+
+# Patient-mode banner, keyed by whether any drug is Toxic or Ineffective.
+PATIENT_BANNER_HTML = {
+    True: """<div class="patient-banner" style="background:#FFF1F2;border-color:#FECACA;">
+          <div class="patient-banner-title" style="color:#B91C1C;">🚨 Important — Some medications need urgent attention</div>
+          <div class="patient-banner-sub" style="color:#7F1D1D;">Your genetic results show that one or more medications may not be safe or effective for you. Please speak with your doctor before taking these medications.</div>
+        </div>""",
+    False: """<div class="patient-banner" style="background:#F0FDF4;border-color:#BBF7D0;">
+          <div class="patient-banner-title" style="color:#14532D;">✓ Good news — Your medications look safe</div>
+          <div class="patient-banner-sub" style="color:#16A34A;">Based on your genetic profile, the medications reviewed are predicted to work normally at standard doses.</div>
+        </div>""",
+}
+
+PERSONA_SEV_CFG = {
+    "critical": {"sev_bg":"#FEF2F2","sev_border":"#FECACA","sev_text":"#7F1D1D","sev_label":"Critical"},
+    "high":     {"sev_bg":"#FFF7ED","sev_border":"#FED7AA","sev_text":"#7C2D12","sev_label":"High Risk"},
+    "moderate": {"sev_bg":"#FFFBEB","sev_border":"#FDE68A","sev_text":"#78350F","sev_label":"Moderate"},
+    "none":     {"sev_bg":"#F0FDF4","sev_border":"#BBF7D0","sev_text":"#14532D","sev_label":"All Safe"},
+}
+PERSONA_SEV_CFG = FallbackDict(PERSONA_SEV_CFG, PERSONA_SEV_CFG["none"])
+
+CRIT_ALERT_TPL = """
+            <div class="crit-alert">
+              <div style="font-size:1.25rem;flex-shrink:0;padding-top:1px;">🚨</div>
+              <div>
+                <div class="crit-title">Critical Safety Alert — {drug}</div>
+                <div class="crit-note">{note}</div>
+                <div class="crit-action">⚡ Contact prescribing physician immediately</div>
+              </div>
+            </div>"""
+
+# Polygenic risk score: per-drug score is the mean of the severity and risk
+# points, weighted by drug; the composite maps onto 20-point label bands.
+PGX_SEV_SCORE  = FallbackDict({"none": 0, "low": 20, "moderate": 45, "high": 70, "critical": 100}, 0)
+PGX_RISK_SCORE = FallbackDict({"Safe": 0, "Adjust Dosage": 35, "Toxic": 85, "Ineffective": 70, "Unknown": 20}, 0)
+PGX_WEIGHT     = FallbackDict({"FLUOROURACIL": 1.4, "AZATHIOPRINE": 1.3, "CLOPIDOGREL": 1.3,
+                               "WARFARIN": 1.2, "CODEINE": 1.1, "SIMVASTATIN": 1.0}, 1.0)
+PGX_LABELS     = ("Low Risk", "Moderate Risk", "High Risk", "Very High Risk", "Critical Risk")
+PGX_COLORS     = ("#16A34A", "#D97706", "#EA580C", "#DC2626", "#B91C1C")
+# Label and colour for every composite score 0..100, indexed directly by score.
+PGX_SCORE_LABEL = tuple(PGX_LABELS[min(4, i // 20)] for i in range(101))
+PGX_SCORE_COLOR = tuple(PGX_COLORS[min(4, i // 20)] for i in range(101))
+
+# HTML fragments with the palette baked in once per key, so renderers fill only
+# the per-drug fields instead of re-probing the config dicts for every card.
+RISK_BADGE_HTML = {
+    rl: (f'<span class="risk-badge" style="background:{rc["tag_bg"]};color:{rc["tag_text"]};'
+         f'border-color:{rc["border"]};">'
+         f'<span style="font-size:.8rem;">{rc["shape"]}</span>{rl}</span>')
+    for rl, rc in RISK_CFG.items()
+}
+
+SEV_TEXT_HTML = {
+    sev: f'<span style="color:{sp["text"]};font-weight:600;">{sp["label"]}</span>'
+    for sev, sp in SEV_CFG.items()
+}
+SEV_TEXT_HTML = FallbackDict(SEV_TEXT_HTML, SEV_TEXT_HTML["none"])
+
+PHENO_TAG_TPL = {
+    rl: (f'<span style="font-family:var(--font-mono);font-size:.8rem;color:{rc["tag_text"]};'
+         f'background:{rc["tag_bg"]};border:1px solid {rc["border"]};padding:2px 8px;'
+         f'border-radius:4px;font-weight:600;">{{ph}}</span>')
+    for rl, rc in RISK_CFG.items()
+}
+PHENO_TAG_TPL = FallbackDict(PHENO_TAG_TPL, PHENO_TAG_TPL["Unknown"])
+
+HM_SHORT = {"Adjust Dosage": "Adjust", "Ineffective": "Ineffect.", "Unknown": "?"}
+
+
+def hm_cell_tpl(rl: str) -> str:
+    """Heatmap cell for one risk label; leaves {d}, {gene} and {ph} to fill."""
+    rc = RISK_CFG[rl]
+    return (f'<div class="hm-cell" style="background:{rc["bg"]};border-color:{rc["border"]};" '
+            f'title="{{d}}×{{gene}}: {rl} ({{ph}})">'
+            f'<div class="hm-cell-name" style="color:{rc["text"]};">{HM_SHORT.get(rl, rl)}</div>'
+            f'<div class="hm-cell-risk" style="color:{rc["text"]};">{{ph}}</div></div>')
+
+
+HM_CELL_TPL = {rl: hm_cell_tpl(rl) for rl in RISK_CFG}
+HM_EMPTY_CELL = ('<div class="hm-cell" style="background:#F1F5F9;border-color:#E8EDF5;">'
+                 '<div class="hm-cell-risk" style="color:#94A3B8;">—</div></div>')
+HM_LEGEND_HTML = "".join(
+    f'<div class="hm-legend-item"><span class="hm-dot" style="background:{RISK_CFG[r]["bg"]};border-color:{RISK_CFG[r]["border"]};"></span><span>{RISK_CFG[r]["shape"]} {r}</span></div>'
+    for r in ("Safe", "Adjust Dosage", "Toxic", "Ineffective"))
+
+# (label, key) of the AI explanation sections, in display order
+AI_SECTIONS = (("Summary", "summary"), ("Biological Mechanism", "biological_mechanism"),
+               ("Variant Significance", "variant_significance"), ("Clinical Implications", "clinical_implications"))
+
+GENE_BOX_TPL = {
+    ph: f"""
+        <div class="gene-box active" style="border-color:{pc['border']};">
+          <div class="gene-nm" style="color:{pc['text']};">{{gene}}</div>
+          <div class="gene-track">
+            <div class="gene-fill" style="width:{min(100, pc['pct'])}%;background:{pc['bar']};"></div>
+          </div>
+          <div class="gene-ph" style="color:{pc['text']};">{{ph}}</div>
+        </div>"""
+    for ph, pc in PHENO_CFG.items()
+}
+GENE_BOX_TPL = FallbackDict(GENE_BOX_TPL, GENE_BOX_TPL["Unknown"])
+GENE_BOX_IDLE_TPL = f"""
+        <div class="gene-box " style="">
+          <div class="gene-nm" style="">{{gene}}</div>
+          <div class="gene-track">
+            <div class="gene-fill" style="width:{min(100, PHENO_CFG['Unknown']['pct'])}%;background:{PHENO_CFG['Unknown']['bar']};"></div>
+          </div>
+          <div class="gene-ph" style="color:var(--text-xmuted);">Unknown</div>
+        </div>"""
+
+POP_FREQ = {
+    "CYP2D6":  {"PM":7,"IM":10,"NM":77,"URM":6},
+    "CYP2C19": {"PM":3,"IM":26,"NM":52,"RM":13,"URM":6},
+    "CYP2C9":  {"PM":1,"IM":10,"NM":89},
+    "SLCO1B1": {"PM":1,"IM":15,"NM":84},
+    "TPMT":    {"PM":0.3,"IM":10,"NM":90},
+    "DPYD":    {"PM":0.2,"IM":3,"NM":97},
+}
+
+# Population rows per gene, pre-sorted by frequency with bar width and palette
+# resolved, so the panel renderer only has to mark the patient's own row.
+POP_FREQ_ROWS = {
+    gene: tuple((p, pct, min(pct, 100), PHENO_CFG[p])
+                for p, pct in sorted(freq.items(), key=lambda x: -x[1]))
+    for gene, freq in POP_FREQ.items()
+}
+
+CHROM_INFO = {
+    "CYP2D6":  {"chrom":"22","band":"q13.2","pos_mb":42.5},
+    "CYP2C19": {"chrom":"10","band":"q23.33","pos_mb":96.7},
+    "CYP2C9":  {"chrom":"10","band":"q23.33","pos_mb":96.4},
+    "SLCO1B1": {"chrom":"12","band":"p12.1","pos_mb":21.3},
+    "TPMT":    {"chrom":"6","band":"p22.3","pos_mb":18.1},
+    "DPYD":    {"chrom":"1","band":"p22.1","pos_mb":97.5},
+}
+CHROM_LEN = {"1":248.9,"6":170.8,"10":133.8,"12":133.3,"22":50.8}
+
+PLAIN_PHENO = {
+    "PM":"Your body barely processes this medicine",
+    "IM":"Your body processes this medicine slower than average",
+    "NM":"Your body processes this medicine normally",
+    "RM":"Your body processes this medicine slightly faster than average",
+    "URM":"Your body processes this medicine dangerously fast",
+    "Unknown":"Gene function unclear",
+}
+
+PLAIN_RISK = {
+    ("CODEINE","PM"):      "Your body can't convert codeine into a painkiller — it won't help your pain.",
+    ("CODEINE","URM"):     "Your body converts codeine to morphine extremely fast. Even one tablet could be life-threatening.",
+    ("CODEINE","IM"):      "Codeine may be less effective. Your doctor may need to try a different painkiller.",
+    ("CODEINE","NM"):      "Codeine works normally for you. Standard doses should manage pain safely.",
+    ("WARFARIN","PM"):     "Warfarin stays in your body much longer than normal. Standard doses could cause dangerous bleeding.",
+    ("WARFARIN","IM"):     "Warfarin clears more slowly. You'll likely need a lower dose.",
+    ("WARFARIN","NM"):     "Warfarin works normally for you. Standard INR monitoring applies.",
+    ("CLOPIDOGREL","PM"):  "This heart medication won't activate properly, leaving you unprotected against blood clots.",
+    ("CLOPIDOGREL","IM"):  "This heart medication activates less than normal. A stronger alternative may be needed.",
+    ("CLOPIDOGREL","NM"):  "This heart medication works normally for you.",
+    ("SIMVASTATIN","PM"):  "This cholesterol drug can't be cleared properly and may build up in your muscles, causing serious damage.",
+    ("SIMVASTATIN","IM"):  "This cholesterol drug clears more slowly. A lower dose will protect your muscles.",
+    ("SIMVASTATIN","NM"):  "This cholesterol drug works normally for you.",
+    ("AZATHIOPRINE","PM"): "This immune drug builds up to dangerous levels. Standard doses would seriously harm your bone marrow.",
+    ("AZATHIOPRINE","IM"): "You need a lower dose of this immune drug to stay safe.",
+    ("AZATHIOPRINE","NM"): "This immune drug works normally for you.",
+    ("FLUOROURACIL","PM"): "Your body cannot break down this chemotherapy. Standard doses would be life-threatening.",
+    ("FLUOROURACIL","IM"): "This chemotherapy breaks down too slowly. You need a significantly reduced dose.",
+    ("FLUOROURACIL","NM"): "This chemotherapy works at a normal rate in your body.",
+}
+
+PERSONAS = {
+    "A":{"label":"Critical Risk","file":"patient_a_critical.vcf","drugs":["CODEINE","FLUOROURACIL","AZATHIOPRINE"],"desc":"CYP2D6 PM · DPYD PM · TPMT PM","sev":"critical"},
+    "B":{"label":"Warfarin PM","file":"patient_b_warfarin.vcf","drugs":["WARFARIN"],"desc":"CYP2C9 *2/*3 Poor Metabolizer","sev":"high"},
+    "C":{"label":"Drug Interaction","file":"patient_c_interaction.vcf","drugs":["CLOPIDOGREL"],"desc":"CYP2C19 *2/*3 Poor Metabolizer","sev":"high"},
+    "D":{"label":"All Safe","file":"patient_d_safe.vcf","drugs":["CODEINE","WARFARIN","SIMVASTATIN"],"desc":"Wildtype *1/*1 all genes","sev":"none"},
+}
+
+# Persona widgets: selectbox options, label lookup and both card styles, built once.
+PERSONA_OPTIONS  = ["None"] + [p["label"] for p in PERSONAS.values()]
+PERSONA_BY_LABEL = {p["label"]: p for p in PERSONAS.values()}
+
+
+def persona_card_html(p: dict) -> str:
+    sc = PERSONA_SEV_CFG[p["sev"]]
+    return f"""
+            <div class="persona-card">
+              <div class="pc-sev" style="background:{sc['sev_bg']};border-color:{sc['sev_border']};color:{sc['sev_text']};">
+                {sc['sev_label']}
+              </div>
+              <div class="pc-name">{p['label']}</div>
+              <div class="pc-desc">{p['desc']}</div>
+            </div>"""
+
+
+def persona_tile_html(p: dict) -> str:
+    sc = PERSONA_SEV_CFG[p["sev"]]
+    bg, border, txt = sc["sev_bg"], sc["sev_border"], sc["sev_text"]
+    return f'''<div style="background:{bg};border:1.5px solid {border};border-radius:10px;
+                        padding:10px 12px;margin-bottom:8px;">
+                        <div style="font-size:.8rem;font-weight:700;color:{txt};">{p["label"]}</div>
+                        <div style="font-family:monospace;font-size:.65rem;color:{txt};opacity:.75;">{p["desc"]}</div>
+                        </div>'''
+
+
+PERSONA_CARD_HTML = {pid: persona_card_html(p) for pid, p in PERSONAS.items()}
+PERSONA_TILE_HTML = {pid: persona_tile_html(p) for pid, p in PERSONAS.items()}
+
+TEST_SUITE = [
+    {"name":"Mixed Variants","file":"sample.vcf","drugs":["CLOPIDOGREL","CODEINE","AZATHIOPRINE"],
+     "expected":{"CLOPIDOGREL":"Ineffective","CODEINE":"Ineffective","AZATHIOPRINE":"Toxic"},
+     "desc":"CYP2C19 *2/*3 · CYP2D6 *4/*4 · TPMT *3B/*3C"},
+    {"name":"UltraRapid Metabolizer","file":"test_ultrarapid_metabolizer.vcf","drugs":["CODEINE","CLOPIDOGREL"],
+     "expected":{"CODEINE":"Toxic","CLOPIDOGREL":"Safe"},"desc":"CYP2D6 *1xN/*1xN → URM → Codeine Toxic"},
+    {"name":"All Normal Wild-type","file":"test_all_normal_wildtype.vcf","drugs":ALL_DRUGS,
+     "expected":{d:"Safe" for d in ALL_DRUGS},"desc":"Wild-type *1/*1 across all 6 genes"},
+    {"name":"Worst Case — All PM","file":"test_worst_case_all_pm.vcf","drugs":ALL_DRUGS,
+     "expected":{"CODEINE":"Ineffective","CLOPIDOGREL":"Ineffective","WARFARIN":"Adjust Dosage","SIMVASTATIN":"Toxic","AZATHIOPRINE":"Toxic","FLUOROURACIL":"Toxic"},
+     "desc":"Loss-of-function alleles across all 6 genes"},
+]
+
+TC_CARD_HTML = [f"""
+            <div class="tc-card">
+              <span class="tc-name">{tc['name']}</span>
+              <span class="tc-desc">{tc['desc']}</span>
+            </div>""" for tc in TEST_SUITE]
+
+# Pass/fail header of a stored test result, pre-bound per outcome: call with name=, source=.
+TC_STATUS_HTML = {
+    passed: (f'<div class="{cls}"><strong>{icon} — {{name}}</strong><br>'
+             '<span style="font-size:.7rem;opacity:.55;">{source}</span></div>').format
+    for passed, cls, icon in ((True, "tc-status-pass", "✓ PASS"), (False, "tc-status-fail", "✗ FAIL"))
+}
+
+TC_RESULT_COLUMNS = ["Drug", "Result", "Expected", "OK", "Phenotype", "Diplotype"]
+TC_RESULT_COLUMN_CONFIG = {"OK": st.column_config.CheckboxColumn("OK", width="small")}
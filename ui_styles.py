@@ -0,0 +1,43 @@
+"""
+Stylesheet loader for SurakshaRx v9.3
+styles.css is the editable source. It is read and minified once per process
+(comments and redundant whitespace stripped) and exposed as APP_CSS, a
+ready-to-inject <style> block, so every rerun ships the compact payload.
+It stays one inline block: Streamlit's static file server sends .css as
+text/plain with nosniff, so browsers refuse a linked copy, and a hand-picked
+first-paint subset would silently miss new component selectors.
+Web fonts are requested through <link> tags ahead of the stylesheet rather
+than a CSS @import, which the browser could only discover after parsing the
+stylesheet; text paints in the fallback stack until they arrive (swap).
+"""
+
+import os
+import re
+
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.css")
+
+FONTS_URL = ("https://fonts.googleapis.com/css2?family=DM+Sans:ital,opsz,wght@0,9..40,300;"
+             "0,9..40,400;0,9..40,500;0,9..40,600;0,9..40,700;1,9..40,400"
+             "&family=JetBrains+Mono:wght@400;500;600&display=swap")
+FONT_LINKS = ('<link rel="preconnect" href="https://fonts.googleapis.com">'
+              '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+              f'<link rel="stylesheet" href="{FONTS_URL}">')
+
+_COMMENT_RE    = re.compile(r"/\*.*?\*/", re.S)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCT_RE      = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_css(css: str) -> str:
+    css = _COMMENT_RE.sub("", css)
+    css = _WHITESPACE_RE.sub(" ", css)
+    css = _PUNCT_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def load_css(path: str = CSS_PATH) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f"{FONT_LINKS}<style>{minify_css(f.read())}</style>"
+
+
+APP_CSS = load_css()
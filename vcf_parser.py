@@ -12,8 +12,10 @@ Supported genotypes:
   ./.         → missing / no call   → SKIP
 """
 
+import io
 import re
-from typing import Dict, List, Optional
+from sys import intern
+from typing import Dict, Iterable, List, Optional, Union
 
 TARGET_GENES = {"CYP2D6", "CYP2C19", "CYP2C9", "SLCO1B1", "TPMT", "DPYD"}
 
@@ -95,8 +97,12 @@ def is_homozygous_alt(gt: Optional[str]) -> bool:
     return len(allele_ints) >= 2 and all(a > 0 for a in allele_ints)
 
 
-def parse_vcf(file_content: str) -> Dict:
-    lines = file_content.strip().split("\n")
+def parse_vcf(file_content: Union[str, Iterable[str]]) -> Dict:
+    """
+    Parse VCF text or any iterable of its lines (e.g. an open text file),
+    one line at a time without splitting the whole input up front.
+    """
+    lines = io.StringIO(file_content) if isinstance(file_content, str) else file_content
     metadata: Dict[str, str] = {}
     variants: List[Dict] = []
     parse_errors: List[str] = []
@@ -163,7 +169,11 @@ def parse_vcf(file_content: str) -> Dict:
             if not gene and rsid:
                 gene = infer_gene_from_rsid(rsid)
 
-            if gene and gene.upper() in TARGET_GENES:
+            # Interned at the parse boundary so the gene keys used downstream
+            # (variants_by_gene, risk/drug tables) compare by identity.
+            gene = intern(gene.upper()) if gene else None
+
+            if gene in TARGET_GENES:
                 # Determine zygosity for diplotype weighting
                 zygosity = "homozygous" if is_homozygous_alt(gt) else "heterozygous"
 
@@ -173,7 +183,7 @@ def parse_vcf(file_content: str) -> Dict:
                     "rsid":              rsid or f"chr{chrom}:{pos}",
                     "ref":               ref,
                     "alt":               alt,
-                    "gene":              gene.upper(),
+                    "gene":              gene,
                     "star_allele":       star_allele,
                     "quality":           qual,
                     "filter":            filter_val,